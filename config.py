@@ -19,12 +19,14 @@ ADDRESS_VOTER_OP = "0x41C914ee0c7E1A5edCD0295623e6dC557B5aBf3C"
 
 ADDRESS_UNIVERSALROUTER_BASE = "0x6Cb442acF35158D5eDa88fe602221b67B400Be3E"
 
+ADDRESS_WETH = "0x4200000000000000000000000000000000000006"  # OP Stack predeploy, same on every chain
+
 CONNECTORS_BASE = (
     "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",  # USDC
     "0x940181a94A35A4569E4529A3CDfB74e38FD98631",  # AERO
     "0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb",  # DAI
     "0x4621b7A9c75199271F773Ebd9A499dbd165c3191",  # DOLA
-    "0x4200000000000000000000000000000000000006",  # WETH
+    ADDRESS_WETH,
     "0xB79DD08EA68A908A97220C76d19A6aA9cBDE4376",  # USD+
     "0xf7A0dd3317535eC4f4d29ADF9d620B3d8D5D5069",  # stERN
     "0xCfA3Ef56d303AE4fAabA0592388F19d7C3399FB4",  # eUSD
@@ -38,7 +40,7 @@ CONNECTORS_BASE = (
 CONNECTORS_OP = (
     "0x9560e827aF36c94D2Ac33a39bCE1Fe78631088Db",  # VELO
     "0x4200000000000000000000000000000000000042",  # OP
-    "0x4200000000000000000000000000000000000006",  # WETH
+    ADDRESS_WETH,
     "0x9Bcef72be871e61ED4fBbc7630889beE758eb81D",  # rETH (Rocket Pool)
     "0x2E3D870790dC77A83DD1d18184Acc7439A53f475",  # FRAX
     "0x8c6f28f2F1A3C87F0f938b96d27520d9751ec8d9",  # sUSD
@@ -57,13 +59,13 @@ CONNECTORS_OP = (
     "0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85",  # USDC
 )
 CONNECTORS_MODE = (
-    "0x4200000000000000000000000000000000000006",  # WETH
+    ADDRESS_WETH,
     "0xDfc7C877a950e49D2610114102175A06C2e3167a",  # MODE
     "0xf0F161fDA2712DB8b566946122a5af183995e2eD",  # USDT
     "0xE7798f023fC62146e8Aa1b36Da45fb70855a77Ea",  # DAI
 )
 CONNECTORS_BOB = (
-    "0x4200000000000000000000000000000000000006",  # WETH
+    ADDRESS_WETH,
     "0x03C7054BCB39f7b2e5B2c7AcB37583e32D70Cfa3",  # WBTC
     "0x05d032ac25d322df992303dca074ee7392c117b9",  # USDT
     "0x6c851f501a3f24e29a8e39a29591cddf09369080",  # DAI
@@ -1,5 +1,6 @@
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sugar import Sugar
@@ -25,7 +26,10 @@ def calculate_max_locked_percentage(chain: str):
 
 
 if __name__ == "__main__":
-    base_percentage = calculate_max_locked_percentage("base")
-    op_percentage = calculate_max_locked_percentage("op")
+    with ThreadPoolExecutor() as executor:
+        base_future = executor.submit(calculate_max_locked_percentage, "base")
+        op_future = executor.submit(calculate_max_locked_percentage, "op")
+        base_percentage = base_future.result()
+        op_percentage = op_future.result()
     print(f"\nveAERO Max Locked Percentage = {base_percentage:.2f}%\n")
     print(f"\nveVELO Max Locked Percentage = {op_percentage:.2f}%\n")
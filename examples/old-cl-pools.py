@@ -1,6 +1,5 @@
 import sys
 import os
-import dotenv
 from web3 import Web3
 from dune_client.client import DuneClient
 from dune_client.query import QueryBase
@@ -9,7 +8,7 @@ import pandas as pd
 import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from sugar import Sugar
+from sugar import Sugar, call_batch, checksum_address, load_env, rpc_provider
 import config
 
 WEEK = 7 * 24 * 60 * 60  # 7 days in seconds
@@ -56,20 +55,22 @@ def get_epoch_start_ts(ts):
 
 class OldClPool:
     def __init__(self, chain, lp_address, abi):
-        dotenv.load_dotenv()
+        load_env()
         try:
             self.chain = chain.lower()
             chain = chain.upper()
             alchemy_key = os.environ[f"RPC_LINK_{chain}"]
-            self.w3 = Web3(Web3.HTTPProvider(alchemy_key))
-            self.pool = self.w3.eth.contract(address=lp_address, abi=abi)
+            self.w3 = Web3(rpc_provider(alchemy_key))
+            self.pool = self.w3.eth.contract(address=checksum_address(lp_address), abi=abi)
         except Exception as e:
             raise ValueError(f"Error initializing CLPool: {str(e)}")
 
     def gauge_fees(self, sugar):
-        fees = self.pool.functions.gaugeFees().call()
-        token_0 = self.pool.functions.token0().call()
-        token_1 = self.pool.functions.token1().call()
+        fees, token_0, token_1 = call_batch(
+            self.w3,
+            [self.pool.functions.gaugeFees(), self.pool.functions.token0(), self.pool.functions.token1()],
+        )
+        fees = list(fees)  # converted in place by _process_gauge_fees
         _list = [[token_0, token_1], fees]
         _list = self._process_gauge_fees(_list, sugar)
         return _list
@@ -79,7 +80,7 @@ class OldClPool:
         decimals = (tokens.loc[_list[0][0], "decimals"], tokens.loc[_list[0][1], "decimals"])
         symbols = [tokens.loc[_list[0][0], "symbol"], tokens.loc[_list[0][1], "symbol"]]
         for i in range(2):
-            _list[1][i] = sugar.from_wei(_list[1][i], decimals[i]).__float__()
+            _list[1][i] = sugar.from_wei(_list[1][i], decimals[i], as_decimal=False)
         _list.extend([symbols])
         return _list
 
@@ -1,6 +1,7 @@
 import sys
 import os
 from typing import Literal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sugar import Sugar
@@ -14,5 +15,8 @@ def update_relay_data(chain: Literal["base", "op"]):
 
 
 if __name__ == "__main__":
-    update_relay_data("base")
-    update_relay_data("op")
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(update_relay_data, chain) for chain in ("base", "op")]
+
+        for future in as_completed(futures):
+            future.result()
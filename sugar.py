@@ -1,5 +1,13 @@
 import os
+import sys
+import json
+import time
+import random
+import asyncio
+import threading
+import itertools
 import dotenv
+import requests
 from web3 import Web3
 from decimal import Decimal
 import pandas as pd
@@ -7,17 +15,67 @@ import config
 from functools import lru_cache, wraps
 from typing import Optional, List, Tuple, Union, Callable, TypeVar, ParamSpec
 
+try:
+    from websockets.exceptions import ConnectionClosed
+except ImportError:  # websockets is only needed for ws:// links
+    ConnectionClosed = ConnectionError
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# dropped connections and timeouts of the ws:// and *.ipc providers, which raise no requests exceptions
+SOCKET_ERRORS = (ConnectionError, TimeoutError, asyncio.TimeoutError, ConnectionClosed)
+RPC_ERRORS = (requests.exceptions.RequestException, *SOCKET_ERRORS)
+
+
+def documented_cache(
+    maxsize: int = None, ttl: Optional[float] = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Wrapper for lru_cache that preserves the original function's docstring.
 
-def documented_cache(maxsize: int = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
-    """Wrapper for lru_cache that preserves the original function's docstring."""
+    With `ttl` set, a cached result is reused for at most `ttl` seconds. `cache_clear()` drops all results.
+    """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        @wraps(func)
         @lru_cache(maxsize=maxsize)
+        def cached(_window: Optional[int], *args: P.args, **kwargs: P.kwargs) -> R:
+            return func(*args, **kwargs)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            window = int(time.monotonic() // ttl) if ttl else None
+            return cached(window, *args, **kwargs)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+def retry_transient(
+    max_retries: int = 3, base: float = 1.0, cap: float = 30.0
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Retry transient RPC failures (dropped connections, timeouts, HTTP 429/5xx) with exponential backoff."""
+
+    def is_transient(e: Exception) -> bool:
+        if isinstance(e, requests.exceptions.HTTPError):
+            return e.response is not None and (e.response.status_code == 429 or e.response.status_code >= 500)
+        return isinstance(e, SOCKET_ERRORS) or isinstance(
+            e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        )
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except RPC_ERRORS as e:
+                    if not is_transient(e):
+                        raise
+                    time.sleep(min(cap, base * 2**attempt * (1 + random.random() / 2)))
             return func(*args, **kwargs)
 
         return wrapper
@@ -25,7 +83,127 @@ def documented_cache(maxsize: int = None) -> Callable[[Callable[P, R]], Callable
     return decorator
 
 
+def batch_rejected(e: Exception) -> bool:
+    """Whether `e` is an endpoint refusing a JSON-RPC batch as a whole, not one of its calls failing."""
+    response = getattr(e, "rpc_response", None)
+    if not isinstance(response, dict) or response.get("id") is not None:
+        return False
+    # a refused batch comes back as a single error object with a null id; rate limits must still back off
+    return (response.get("error") or {}).get("code") not in (429, -32005)
+
+
+@retry_transient()
+def call_batch(w3: Web3, calls: list) -> list:
+    """Execute contract calls in a single JSON-RPC batch, one by one if batching is unsupported."""
+    try:
+        with w3.batch_requests() as batch:
+            for call in calls:
+                batch.add(call)
+            return batch.execute()
+    except (AttributeError, NotImplementedError):
+        # web3 < 7 has no batch_requests() and some providers cannot send batches
+        return [call.call() for call in calls]
+    except Exception as e:
+        # transport, rate-limit and contract errors propagate, so retries back off and pages can shrink
+        if not batch_rejected(e):
+            raise
+        return [call.call() for call in calls]
+
+
+@retry_transient()
+def call_retry(call):
+    """Execute a single contract call, retrying transient RPC failures."""
+    return call.call()
+
+
+@lru_cache(maxsize=None)
+def load_abi(name: str) -> list:
+    """Parse an ABI JSON string from config once. The returned list is shared and must not be mutated."""
+    return json.loads(getattr(config, name))
+
+
+def checksum_address(address: str) -> str:
+    """Cached Web3.to_checksum_address, which hashes the address with keccak256 on every call."""
+    # keyed on the lowercased address so every casing of one address shares a cache entry
+    return _checksum_address(address.lower())
+
+
+@lru_cache(maxsize=8192)
+def _checksum_address(address: str) -> str:
+    # interned so equal addresses compare by identity in the dict/set lookups downstream
+    return sys.intern(Web3.to_checksum_address(address))
+
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def http_session() -> requests.Session:
+    """Process-wide keep-alive session, so every HTTP provider shares one connection pool per RPC host."""
+    global _http_session
+    # one session per process even when Sugar is built from several threads at once
+    with _http_session_lock:
+        if _http_session is None:
+            pool_size = int(os.environ.get("SUGAR_HTTP_POOL_SIZE", 32))
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            _http_session = requests.Session()
+            _http_session.mount("http://", adapter)
+            _http_session.mount("https://", adapter)
+        return _http_session
+
+
+def rpc_provider(rpc_link: str):
+    """
+    Create a provider for `rpc_link`.
+
+    ws:// and wss:// links get a persistent WebSocket connection and *.ipc paths an IPC provider. Anything
+    else gets an HTTP provider whose keep-alive connection pool fits batched and threaded calls.
+    """
+    if rpc_link.startswith(("ws://", "wss://")):
+        try:
+            from web3 import LegacyWebSocketProvider as WebSocketProvider
+        except ImportError:  # web3 < 7
+            from web3 import WebsocketProvider as WebSocketProvider
+        return WebSocketProvider(rpc_link, websocket_kwargs={"max_size": 2**24})
+    if rpc_link.endswith(".ipc"):
+        return Web3.IPCProvider(rpc_link)
+    return Web3.HTTPProvider(rpc_link, session=http_session())
+
+
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load .env once per process; dotenv.load_dotenv() re-reads and re-parses the file on every call."""
+    dotenv.load_dotenv()
+
+
+def wei_to_ether(series: pd.Series) -> pd.Series:
+    """Convert a column of wei amounts to ether rounded to 3 decimals, in one vectorized pass."""
+    # float64 keeps ~15 significant digits, plenty for 3-decimal ether amounts
+    return (series.astype("float64") / 1e18).round(3)
+
+
+@lru_cache(maxsize=None)
+def decimal_scale(decimals: int) -> Decimal:
+    """Decimal(10**decimals), cached because from_wei runs once per converted value."""
+    return Decimal(10**decimals)
+
+
 class Sugar:
+    __slots__ = (
+        "chain",
+        "w3",
+        "has_ve",
+        "lp",
+        "connectors",
+        "_relay",
+        "_relay_address",
+        "_ve",
+        "_ve_address",
+        "_page_limits",
+        "_block_number",
+        "_block_ts",
+    )
+
     def __init__(
         self,
         chain: str,
@@ -34,29 +212,63 @@ class Sugar:
         ve_address: Optional[str] = None,
     ):
         """Initialize Sugar for making Sugar calls on specified chain."""
-        dotenv.load_dotenv()
+        load_env()
         try:
             self.chain = chain.lower()
             chain = chain.upper()
             alchemy_key = os.environ[f"RPC_LINK_{chain}"]
-            self.w3 = Web3(Web3.HTTPProvider(alchemy_key))
+            self.w3 = Web3(rpc_provider(alchemy_key))
+            self.has_ve = chain in ("OP", "BASE")
             self.lp = self._initialize_contract("LP", lp_address, chain)
-            if chain in ["OP", "BASE"]:
-                self.relay = self._initialize_contract("RELAY", relay_address, chain)
-                self.ve = self._initialize_contract("VE", ve_address, chain)
-            self.connectors = getattr(config, f"CONNECTORS_{chain}")
+            self._relay_address = relay_address
+            self._ve_address = ve_address
+            self._relay = None
+            self._ve = None
+            self._page_limits = {}
+            self._block_number = None
+            self._block_ts = float("-inf")
+            self.connectors = tuple(
+                checksum_address(connector) for connector in getattr(config, f"CONNECTORS_{chain}")
+            )
         except Exception as e:
             raise ValueError(f"Error initializing Sugar: {str(e)}")
 
+    @property
+    def block_number(self) -> int:
+        """Latest block number, reused for 1.5 seconds so bursts of reads cost a single RPC call."""
+        now = time.monotonic()
+        if now - self._block_ts > 1.5:
+            self._block_number = self.w3.eth.block_number
+            self._block_ts = now
+        return self._block_number
+
+    @property
+    def relay(self):
+        """RelaySugar contract, initialized on first access."""
+        if self._relay is None:
+            self._relay = self._initialize_optional_contract("RELAY", self._relay_address)
+        return self._relay
+
+    @property
+    def ve(self):
+        """VeSugar contract, initialized on first access."""
+        if self._ve is None:
+            self._ve = self._initialize_optional_contract("VE", self._ve_address)
+        return self._ve
+
+    def _initialize_optional_contract(self, contract_type: str, address: Optional[str]):
+        """Initialize a contract that is only deployed on chains with ve support."""
+        if not self.has_ve:
+            raise ValueError(f"{contract_type.capitalize()}Sugar is not available on {self.chain}")
+        return self._initialize_contract(contract_type, address, self.chain.upper())
+
     def _initialize_contract(self, contract_type: str, address: Optional[str], chain: str):
         """Initialize a contract object."""
-        if address:
-            return self.w3.eth.contract(address, abi=getattr(config, f"ABI_{contract_type}_SUGAR_{chain}"))
-        else:
-            return self.w3.eth.contract(
-                getattr(config, f"ADDRESS_{contract_type}_SUGAR_{chain}"),
-                abi=getattr(config, f"ABI_{contract_type}_SUGAR_{chain}"),
-            )
+        address = address or getattr(config, f"ADDRESS_{contract_type}_SUGAR_{chain}")
+        return self.w3.eth.contract(
+            checksum_address(address),
+            abi=load_abi(f"ABI_{contract_type}_SUGAR_{chain}"),
+        )
 
     @documented_cache(maxsize=32)
     def relay_all(
@@ -82,22 +294,21 @@ class Sugar:
         path_data_raw = f"{directory}/raw_relay_all_{self.chain}.txt"
 
         if override:
-            block = self.w3.eth.block_number
+            block = self.block_number
             print("\nStating RelaySugar.all() call\n")
             call = self.relay.functions.all("0x0000000000000000000000000000000000000000").call()
             os.makedirs(directory, exist_ok=True)
-            call = str(call)
             with open(path_data_raw, "w") as f:
-                f.write(call)
+                f.write(str(call))
         else:
             with open(path_data_raw, "r") as f:
-                call = f.read()
+                call = eval(f.read())
             block = None
 
         if block:
             print(f"{block = }")
 
-        data = pd.DataFrame(eval(call), columns=config.COLUMNS_RELAY)
+        data = pd.DataFrame(call, columns=config.COLUMNS_RELAY)
         data.set_index("venft_id", inplace=True)
         for col in config.COLUMNS_RELAY_ETH:
             if col == "votes":
@@ -106,7 +317,7 @@ class Sugar:
                     axis=1,
                 )
             else:
-                data[col] = data[col].apply(lambda x: self.w3.from_wei(x, "ether").__round__(3))
+                data[col] = wei_to_ether(data[col])
 
         if filter_inactive:
             data = data[~data["inactive"]]
@@ -122,7 +333,7 @@ class Sugar:
 
         return data, block
 
-    def _process_votes(self, votes: str, used_voting_amount: int) -> str:
+    def _process_votes(self, votes: str, used_voting_amount: float) -> str:
         """Process votes from RelaySugar.all() call."""
         if not votes:
             return str([])
@@ -130,7 +341,7 @@ class Sugar:
             [
                 (
                     tup[0],
-                    (self.w3.from_wei(tup[1], "ether") / used_voting_amount).__round__(3).__float__(),
+                    round(tup[1] / 1e18 / used_voting_amount, 3),
                 )
                 for tup in votes
             ]
@@ -142,6 +353,7 @@ class Sugar:
         limit: int = 1000,
         listed: bool = True,
         override: bool = True,
+        batch_size: int = 4,
     ) -> pd.DataFrame:
         """
         Fetch and process LpSugar.tokens() data.
@@ -150,21 +362,24 @@ class Sugar:
             limit (int, default=1000): The maximum number of tokens to fetch per call.
             listed (bool, default=True): Whether to filter for only listed tokens.
             override (bool, default=True): Whether to override existing data.
+            batch_size (int, default=4): The number of pages to request per JSON-RPC batch.
 
         Returns:
             pd.DataFrame: Processed LpSugar tokens data.
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         directory = "data-lp"
         path_data_raw = f"{directory}/raw_lp_tokens_{self.chain}.txt"
 
         if override:
-            all_calls = self._fetch_lp_tokens(limit)
+            all_calls = self._fetch_lp_tokens(limit, batch_size)
             os.makedirs(directory, exist_ok=True)
             with open(path_data_raw, "w") as f:
-                f.write(all_calls)
+                f.write(str(all_calls))
         else:
             with open(path_data_raw, "r") as f:
-                all_calls = f.read()
+                all_calls = eval(f.read())
 
         data = self._process_lp_tokens(all_calls, listed)
 
@@ -174,32 +389,43 @@ class Sugar:
 
         return data
 
-    def _fetch_lp_tokens(self, limit: int) -> str:
-        """Fetch data from LpSugar.tokens() calls."""
+    def _fetch_lp_tokens(self, limit: int, batch_size: int) -> list:
+        """Fetch data from LpSugar.tokens() calls, requesting `batch_size` pages per round trip."""
+        tokens = self.lp.functions.tokens
         offset = 0
         all_calls = []
         print("\nStarting LpSugar.tokens() calls\n")
         while True:
+            offsets = [offset + i * limit for i in range(batch_size)]
+            # connectors only need to be fetched once, so they are sent with the first page alone
+            connectors = [self.connectors if page_offset == 0 else () for page_offset in offsets]
             try:
-                call = self.lp.functions.tokens(
-                    limit,
-                    offset,
-                    "0x0000000000000000000000000000000000000000",
-                    self.connectors,
-                ).call()
-                if len(call) == len(self.connectors):
-                    break
-                all_calls.extend(str(call))
-                offset += limit
-                print(f"{offset = }")
+                calls = self._call_batch(
+                    [
+                        tokens(
+                            limit,
+                            page_offset,
+                            "0x0000000000000000000000000000000000000000",
+                            page_connectors,
+                        )
+                        for page_offset, page_connectors in zip(offsets, connectors)
+                    ]
+                )
             except Exception as e:
-                print(f"Error in _fetch_lp_tokens: {e}")
+                # call_batch has already retried transient errors; a partial token list must not be cached
+                raise ValueError(f"Error in _fetch_lp_tokens at offset {offset}: {e}") from e
+            # a page holding nothing beyond the connectors sent with it is past the last pool
+            pages = [call for call, sent in zip(calls, connectors) if len(call) > len(sent)]
+            all_calls.extend(pages)
+            offset += limit * batch_size
+            print(f"{offset = }")
+            if len(pages) < len(calls):
                 break
-        return str("".join(all_calls)).replace("][", ", ")
+        return list(itertools.chain.from_iterable(all_calls))
 
-    def _process_lp_tokens(self, all_calls: str, listed: bool) -> pd.DataFrame:
+    def _process_lp_tokens(self, all_calls: list, listed: bool) -> pd.DataFrame:
         """Process data from LpSugar.tokens() calls."""
-        data = pd.DataFrame(eval(all_calls), columns=config.COLUMNS_TOKEN)
+        data = pd.DataFrame(all_calls, columns=config.COLUMNS_TOKEN)
         data.drop_duplicates(inplace=True)
         data.set_index("token_address", inplace=True)
         data.drop("account_balance", axis=1, inplace=True)
@@ -208,7 +434,14 @@ class Sugar:
         return data
 
     @documented_cache(maxsize=32)
-    def lp_all(self, limit: int = 500, index_lp: bool = False, override: bool = True) -> pd.DataFrame:
+    def lp_all(
+        self,
+        limit: int = 500,
+        index_lp: bool = False,
+        override: bool = True,
+        batch_size: int = 4,
+        max_limit: Optional[int] = None,
+    ) -> pd.DataFrame:
         """
         Fetch and process LpSugar.all() data.
 
@@ -216,21 +449,25 @@ class Sugar:
             limit (int, default=500): The number of records to fetch per call
             index_lp (bool, default=False): Whether to set the LP address as the index
             override (bool, default=True): Whether to fetch new data or use cached data
+            batch_size (int, default=4): The number of pages to request per JSON-RPC batch
+            max_limit (Optional[int], default=None): Largest page size `limit` may grow to
 
         Returns:
             A pandas DataFrame containing the processed LpSugar.all() data
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         directory = "data-lp"
         path_data_raw = f"{directory}/raw_lp_all_{self.chain}.txt"
 
         if override:
-            all_calls = self._fetch_lp_all(limit)
+            all_calls = self._fetch_lp_all(limit, batch_size, max_limit)
             os.makedirs(directory, exist_ok=True)
             with open(path_data_raw, "w") as f:
-                f.write(all_calls)
+                f.write(str(all_calls))
         else:
             with open(path_data_raw, "r") as f:
-                all_calls = f.read()
+                all_calls = eval(f.read())
 
         data = self._process_lp_all(all_calls, index_lp)
 
@@ -240,47 +477,76 @@ class Sugar:
 
         return data
 
-    def _fetch_lp_all(self, limit: int) -> str:
-        """Fetch data from LpSugar.all() calls."""
+    def _fetch_lp_all(self, limit: int, batch_size: int, max_limit: Optional[int] = None) -> list:
+        """
+        Fetch data from LpSugar.all() calls, requesting `batch_size` pages per round trip.
+
+        Halves the page on a contract or gas-cap error (down to 1); other RPC failures propagate.
+        """
+        max_limit = max_limit if max_limit and max_limit > limit else 0
+        limit = min(limit, self._page_limits.get("all", limit))
+        successes = 0
+        lp_all = self.lp.functions.all
         offset = 0
         all_calls = []
         print("\nStarting LpSugar.all() calls\n")
         while True:
             try:
-                call = self.lp.functions.all(
-                    limit,
-                    offset,
-                ).call()
-                if not call:
-                    break
-                all_calls.extend(str(call))
-                offset += limit
-                print(f"{offset = }")
-            except Exception:
+                calls = self._call_batch([lp_all(limit, offset + i * limit) for i in range(batch_size)])
+            except RPC_ERRORS:
+                # call_batch has already retried transient errors; shrinking the page will not help
+                raise
+            except Exception as e:
+                if limit == 1:
+                    raise ValueError(f"Error in _fetch_lp_all at offset {offset}: {e}") from e
+                self._page_limits["all_failed"] = min(limit, self._page_limits.get("all_failed", limit))
+                limit = self._page_limits["all"] = max(limit // 2, 1)
+                successes = 0
+                print(f"{limit = }")
+                continue
+            all_calls.extend(calls)
+            offset += limit * batch_size
+            print(f"{offset = }")
+            # all() returns full pages until the pool list runs out, so a short page is the last one
+            if any(len(call) < limit for call in calls):
                 break
-        return str("".join(all_calls)).replace("][", ", ")
-
-    def _process_lp_all(self, all_calls: str, index_lp: bool) -> pd.DataFrame:
+            successes += 1
+            grown = min(limit * 2, max_limit)
+            if successes >= 3 and limit < grown < self._page_limits.get("all_failed", float("inf")):
+                limit = grown
+                successes = 0
+                print(f"{limit = }")
+        return list(itertools.chain.from_iterable(all_calls))
+
+    def _call_batch(self, calls: list) -> list:
+        """Execute contract calls on this chain in a single JSON-RPC batch."""
+        return call_batch(self.w3, calls)
+
+    def _process_lp_all(self, all_calls: list, index_lp: bool) -> pd.DataFrame:
         """Process data from LpSugar.all() calls."""
         if self.chain in ["op", "base"]:
-            data = pd.DataFrame(eval(all_calls), columns=config.COLUMNS_LP)
+            data = pd.DataFrame(all_calls, columns=config.COLUMNS_LP)
         else:
-            data = pd.DataFrame(eval(all_calls), columns=config.COLUMNS_LP[0:-1])
+            data = pd.DataFrame(all_calls, columns=config.COLUMNS_LP[0:-1])
         data.drop_duplicates(inplace=True)
 
-        tokens = self.lp_tokens(listed=False, override=False)
-        data_cl = data[data["symbol"] == ""]
-        data_cl["symbol"] = data_cl.apply(
-            lambda row: f"CL{row['type']}-{tokens.loc[row['token0'], 'symbol']}/{tokens.loc[row['token1'], 'symbol']}",
-            axis=1,
+        # CL pools have no on-chain symbol, so build "CL<tick spacing>-<symbol0>/<symbol1>" column-wise
+        symbols = self.lp_tokens(listed=False, override=False)["symbol"].to_dict()
+        cl = data["symbol"] == ""
+        data.loc[cl, "symbol"] = (
+            "CL"
+            + data.loc[cl, "type"].astype(str)
+            + "-"
+            + data.loc[cl, "token0"].map(symbols).fillna("UNKNOWN")
+            + "/"
+            + data.loc[cl, "token1"].map(symbols).fillna("UNKNOWN")
         )
-        data.update(data_cl)
 
         if index_lp:
             data.set_index("lp", inplace=True)
         return data
 
-    @documented_cache(maxsize=32)
+    @documented_cache(maxsize=32, ttl=60)
     def lp_epochsByAddress(
         self,
         address: str,
@@ -309,10 +575,10 @@ class Sugar:
             call = self._fetch_lp_epochsByAddress(address, limit)
             os.makedirs(directory, exist_ok=True)
             with open(path_data_raw, "w") as f:
-                f.write(call)
+                f.write(str(call))
         else:
             with open(path_data_raw, "r") as f:
-                call = f.read()
+                call = eval(f.read())
 
         data = self._process_lp_epochsByAddress(call, columns_export, columns_rename)
 
@@ -322,27 +588,28 @@ class Sugar:
 
         return data
 
-    def _fetch_lp_epochsByAddress(self, address: str, limit: int) -> str:
+    def _fetch_lp_epochsByAddress(self, address: str, limit: int) -> list:
         """Fetch data from LpSugar.epochsByAddress() calls."""
         print("\nStarting LpSugar.epochsByAddress() call\n")
-        call = self.lp.functions.epochsByAddress(limit, 0, address).call()
-        return str(call)
+        return self.lp.functions.epochsByAddress(limit, 0, checksum_address(address)).call()
 
     def _process_lp_epochsByAddress(
         self,
-        call: str,
+        call: list,
         columns_export: Optional[Tuple[str]] = None,
         columns_rename: Optional[frozenset] = None,
     ) -> pd.DataFrame:
         """Process data from LpSugar.epochsByAddress() calls."""
         data_tokens = self.lp_tokens(listed=False, override=False)
-        data = pd.DataFrame(eval(call), columns=config.COLUMNS_LP_EPOCH)
+        # plain dict lookups instead of a DataFrame .loc per reward tuple
+        token_decimals = data_tokens["decimals"].to_dict()
+        data = pd.DataFrame(call, columns=config.COLUMNS_LP_EPOCH)
 
         for col in config.COLUMNS_LP_EPOCH_CONVERT:
             if col in ("emissions", "votes"):
-                data[col] = data[col].apply(lambda x: self.from_wei(x, 18))
+                data[col] = data[col].astype("float64") / 1e18
             else:
-                data[col] = data.apply(lambda row: self._process_rewards(row[col], data_tokens), axis=1)
+                data[col] = data[col].apply(lambda x: self._process_rewards(x, token_decimals))
 
         if columns_export:
             data = data[list(columns_export)]
@@ -350,7 +617,7 @@ class Sugar:
             data.rename(columns=dict(columns_rename), inplace=True)
         return data
 
-    def _process_rewards(self, rewards: str, data_tokens: pd.DataFrame) -> str:
+    def _process_rewards(self, rewards: str, token_decimals: dict) -> str:
         """Process rewards from LpSugar.epochsByAddress() call."""
         if not rewards:
             return str([])
@@ -358,7 +625,7 @@ class Sugar:
             [
                 (
                     tup[0],
-                    self.from_wei(tup[1], data_tokens.loc[tup[0], "decimals"]).__float__(),
+                    self.from_wei(tup[1], token_decimals[tup[0]], as_decimal=False),
                 )
                 for tup in rewards
             ]
@@ -399,10 +666,10 @@ class Sugar:
             all_calls, block = self._fetch_ve_all(limit, relay_idx, relay_len)
             os.makedirs(directory, exist_ok=True)
             with open(path_data_raw, "w") as f:
-                f.write(all_calls)
+                f.write(str(all_calls))
         else:
             with open(path_data_raw, "r") as f:
-                all_calls = f.read()
+                all_calls = eval(f.read())
             block = None
 
         if block:
@@ -416,12 +683,13 @@ class Sugar:
 
         return data, block
 
-    def _fetch_ve_all(self, limit: int, relay_idx: List[int], relay_len: int) -> Tuple[str, int]:
+    def _fetch_ve_all(self, limit: int, relay_idx: List[int], relay_len: int) -> Tuple[list, int]:
         """Fetch data from VeSugar.all() calls."""
+        ve_all = self.ve.functions.all
         all_calls = []
         _offset = 1
         _limit = limit
-        block = self.w3.eth.block_number
+        block = self.block_number
         i = 0
         count = 0
         print("\nStarting veSugar.all() calls\n")
@@ -440,32 +708,35 @@ class Sugar:
                     i += 1
                     count = 0
             try:
-                call = self.ve.functions.all(_limit, _offset).call()
+                call = call_retry(ve_all(_limit, _offset))
                 if not call:
                     break
                 if count == 0:
                     _limit = limit
-                all_calls.extend(str(call))
+                all_calls.append(call)
                 _offset = call[-1][0] + 1
                 print(f"{_offset = }")
+            except RPC_ERRORS as e:
+                # retries exhausted; a partial veNFT list must not be cached
+                raise ValueError(f"Error in _fetch_ve_all at offset {_offset}: {e}") from e
             except Exception:
                 _limit = max(_limit // 2, 1)
                 if _limit == 1:
                     _offset += 1
                     _limit = limit
                 count += 1
-        return str("".join(all_calls)).replace("][", ", "), block
+        return list(itertools.chain.from_iterable(all_calls)), block
 
     def _process_ve_all(
         self,
-        all_calls: str,
+        all_calls: list,
         columns_export: Optional[Tuple[str]],
         columns_rename: Optional[frozenset],
         weights: bool,
         index_id: bool,
     ) -> pd.DataFrame:
         """Process data from VeSugar.all() calls."""
-        data = pd.DataFrame(eval(all_calls), columns=config.COLUMNS_VENFT)
+        data = pd.DataFrame(all_calls, columns=config.COLUMNS_VENFT)
         data.drop_duplicates(inplace=True, subset="id")
         if index_id:
             data.set_index("id", inplace=True)
@@ -479,7 +750,7 @@ class Sugar:
                     axis=1,
                 )
             else:
-                data[col] = data[col].apply(lambda x: self.w3.from_wei(x, "ether").__round__(3))
+                data[col] = wei_to_ether(data[col])
 
         if columns_export:
             data = data[list(columns_export)]
@@ -487,7 +758,7 @@ class Sugar:
             data.rename(columns=dict(columns_rename), inplace=True)
         return data
 
-    def _process_ve_votes(self, votes: str, governance_amount: int, weights: bool):
+    def _process_ve_votes(self, votes: str, governance_amount: float, weights: bool):
         """Process votes from VeSugar.all() calls."""
         if not votes:
             return str([])
@@ -496,9 +767,7 @@ class Sugar:
                 [
                     (
                         tup[0],
-                        min((self.w3.from_wei(tup[1], "ether") / governance_amount), 1)
-                        .__round__(3)
-                        .__float__(),
+                        round(min(tup[1] / 1e18 / governance_amount, 1), 3),
                     )
                     for tup in votes
                     if governance_amount != 0
@@ -506,7 +775,7 @@ class Sugar:
             )
         else:
             return str(
-                [(tup[0], self.w3.from_wei(tup[1], "ether").__round__(3).__float__()) for tup in votes]
+                [(tup[0], round(tup[1] / 1e18, 3)) for tup in votes]
             )
 
     def voters(
@@ -524,9 +793,11 @@ class Sugar:
         data_ve, _ = self.ve_all(columns_export=cols, weights=False, override=False)
         data_lp = self.lp_all(index_lp=True, override=False)
 
+        votes_by_pool = self._index_votes(data_ve)
+
         data_master = pd.DataFrame()
         for addy in pool_address:
-            data = self._process_voters(data_ve, addy)
+            data = self._process_voters(data_ve, votes_by_pool, addy)
             symbol, symbol_file = self._get_symbol(data_lp, addy, pool_address, pool_names)
 
             if master_export:
@@ -546,18 +817,22 @@ class Sugar:
         if master_export and num_pools > 1:
             self._export_master_voters(data_master, block_num)
 
-    def _process_voters(self, data_ve: pd.DataFrame, addy: str) -> pd.DataFrame:
-        """Process voters for a specific pool."""
-        matches = []
-        votes = []
-        for venft, row in data_ve.iterrows():
-            if row["governance_amount"] == 0:
+    def _index_votes(self, data_ve: pd.DataFrame) -> dict:
+        """Group veNFT votes by lowercased pool address, parsing each vote list once."""
+        votes_by_pool = {}
+        rows = zip(data_ve.index, data_ve["governance_amount"], data_ve["votes"])
+        for venft, governance_amount, ray in rows:
+            if governance_amount == 0:
                 continue
-            ray = eval(row["votes"])
-            for tup in ray:
-                if tup[0].lower() == addy.lower():
-                    matches.append(venft)
-                    votes.append(tup[1])
+            for tup in eval(ray):
+                matches, votes = votes_by_pool.setdefault(tup[0].lower(), ([], []))
+                matches.append(venft)
+                votes.append(tup[1])
+        return votes_by_pool
+
+    def _process_voters(self, data_ve: pd.DataFrame, votes_by_pool: dict, addy: str) -> pd.DataFrame:
+        """Process voters for a specific pool."""
+        matches, votes = votes_by_pool.get(addy.lower(), ([], []))
 
         data = data_ve.loc[matches, :].copy()
         data["governance_amount"] = votes
@@ -626,11 +901,11 @@ class Sugar:
         path_csv = f"{directory}/relay_depositors_{self.chain}_{block_num}_{mveNFT_ID}.csv"
         self._export_csv(data, path_csv, directory)
 
-    def from_wei(self, number: int, decimals: int) -> Decimal:
-        """Convert wei to a decimal."""
-        number = int(number)
-        decimals = int(decimals)
-        return Decimal(number) / Decimal(10**decimals)
+    def from_wei(self, number: int, decimals: int, as_decimal: bool = True) -> Union[Decimal, float]:
+        """Convert wei to a decimal, or straight to a float when `as_decimal` is False."""
+        if not as_decimal:
+            return int(number) / 10 ** int(decimals)
+        return Decimal(int(number)) / decimal_scale(int(decimals))
 
     def to_wei(self, number: Union[Decimal, int, float], decimals: int) -> int:
         """Convert a decimal to wei."""